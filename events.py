@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Queue policies for a subscriber that cannot keep up:
+#   block       - the publisher waits for room once the queue is full (backpressure)
+#   drop_new    - the incoming event is discarded once the queue is full
+#   drop_oldest - the oldest queued event is discarded to make room
+#   coalesce    - a newer event for a target replaces its pending one, so at most
+#                 one event per target is queued; events for new targets are
+#                 discarded once maxsize targets are pending
+POLICY_BLOCK = "block"
+POLICY_DROP_NEW = "drop_new"
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_COALESCE = "coalesce"
+POLICIES = (POLICY_BLOCK, POLICY_DROP_NEW, POLICY_DROP_OLDEST, POLICY_COALESCE)
+
+
+class CheckResult(NamedTuple):
+    """Compact, immutable result of a single check, as published on the bus."""
+    description: str
+    type_: str
+    status: str
+    latency: Optional[str]
+    error: Optional[str]
+    timestamp: float
+
+
+def make_result(description: str, type_: str, status: str, latency: Optional[str] = None, error: Optional[str] = None) -> CheckResult:
+    return CheckResult(description, type_, status, latency, error, time.time())
+
+
+Handler = Callable[[CheckResult], Awaitable[None]]
+
+
+class Subscription:
+    """A named subscriber with its own bounded queue and worker task."""
+
+    def __init__(self, name: str, handler: Handler, maxsize: int, policy: str):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy for subscriber '{name}': {policy}")
+        if maxsize < 1:
+            raise ValueError(f"Queue size for subscriber '{name}' must be at least 1")
+        self.name = name
+        self.handler = handler
+        self.policy = policy
+        # A coalescing queue holds descriptions, one per pending target
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.pending: Dict[str, CheckResult] = {}
+        self.task: Optional[asyncio.Task] = None
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+
+    async def _run(self):
+        queue = self.queue
+        handler = self.handler
+        coalesce = self.policy == POLICY_COALESCE
+        while True:
+            event = await queue.get()
+            if coalesce:
+                event = self.pending.pop(event)
+            try:
+                await handler(event)
+                self.delivered += 1
+            except Exception as e:
+                # A broken subscriber must never take the bus or other subscribers down
+                self.failed += 1
+                logger.error(f"Subscriber '{self.name}' failed on {event.description}: {e}", exc_info=True)
+            finally:
+                queue.task_done()
+
+
+class EventBus:
+    """In-process publish/subscribe bus for check results.
+
+    Every subscriber runs as its own task and consumes from its own bounded
+    queue, so a slow consumer only affects itself (or, with the block policy,
+    applies backpressure to the publishers) instead of the probe path.
+    """
+
+    def __init__(self):
+        self._subscriptions: List[Subscription] = []
+        self.published = 0
+
+    def subscribe(self, name: str, handler: Handler, maxsize: int = 1024, policy: str = POLICY_BLOCK) -> Subscription:
+        """Register an async handler. Must be called from within the running event loop."""
+        subscription = Subscription(name, handler, maxsize, policy)
+        subscription.task = asyncio.get_running_loop().create_task(subscription._run(), name=f"pymon-subscriber-{name}")
+        self._subscriptions.append(subscription)
+        return subscription
+
+    async def publish(self, event: CheckResult):
+        """Deliver an event to every subscriber according to its queue policy."""
+        self.published += 1
+        for subscription in self._subscriptions:
+            queue = subscription.queue
+            if subscription.policy == POLICY_COALESCE:
+                pending = subscription.pending
+                if event.description in pending:
+                    subscription.dropped += 1
+                elif queue.full():
+                    subscription.dropped += 1
+                    continue
+                else:
+                    queue.put_nowait(event.description)
+                pending[event.description] = event
+            elif not queue.full():
+                queue.put_nowait(event)
+            elif subscription.policy == POLICY_BLOCK:
+                await queue.put(event)
+            elif subscription.policy == POLICY_DROP_OLDEST:
+                queue.get_nowait()
+                queue.task_done()
+                queue.put_nowait(event)
+                subscription.dropped += 1
+            else:
+                subscription.dropped += 1
+
+    async def drain(self, names: Optional[Iterable[str]] = None, timeout: Optional[float] = None) -> bool:
+        """Wait until the named subscribers (default: all) have processed all events queued so far.
+
+        Returns False if the timeout expired or a subscriber task is no longer
+        running, so a stuck subscriber can never hang the caller.
+        """
+        names = set(names) if names is not None else None
+        joins = []
+        for subscription in self._subscriptions:
+            if names is not None and subscription.name not in names:
+                continue
+            if subscription.task is None or subscription.task.done():
+                logger.error(f"Subscriber '{subscription.name}' is not running, cannot drain it")
+                return False
+            joins.append(subscription.queue.join())
+        try:
+            await asyncio.wait_for(asyncio.gather(*joins), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self):
+        """Stop all subscriber tasks. Events still queued are discarded."""
+        tasks = [s.task for s in self._subscriptions if s.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._subscriptions.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-subscriber delivery counters, for logging and metrics.
+
+        For coalescing subscribers, dropped also counts events superseded by a
+        newer result for the same target before they were handled.
+        """
+        return {
+            s.name: {
+                "queued": s.queue.qsize(),
+                "delivered": s.delivered,
+                "dropped": s.dropped,
+                "failed": s.failed,
+            }
+            for s in self._subscriptions
+        }
+
+
+class Outbox:
+    """Bounded queue of outgoing notifications, sent by one background task.
+
+    Subscribers post() without waiting, so a slow or unreachable notification
+    service never holds up the bus. When the outbox is full, new messages are
+    dropped and counted rather than applying backpressure; once the backlog is
+    sent, a single summary message reports how many were suppressed.
+    """
+
+    overflow_message = "⚠️ {count} more alerts suppressed; see next status report"
+
+    def __init__(self, name: str, send: Callable[[str], Awaitable[Any]], maxsize: int = 1000):
+        if maxsize < 1:
+            raise ValueError(f"Queue size for outbox '{name}' must be at least 1")
+        self.name = name
+        self.send = send
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        # Dropped since the last overflow summary was sent
+        self._suppressed = 0
+
+    def start(self):
+        """Start the sender task. Must be called from within the running event loop."""
+        self.task = asyncio.get_running_loop().create_task(self._run(), name=f"pymon-outbox-{self.name}")
+
+    def post(self, message: str) -> bool:
+        """Queue a message for sending; returns False if it was dropped."""
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            # Counted only; the owner logs drops in aggregate
+            self.dropped += 1
+            self._suppressed += 1
+            return False
+
+    async def _send(self, message: str):
+        try:
+            await self.send(message)
+            self.sent += 1
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Outbox '{self.name}' failed to send message: {e}", exc_info=True)
+
+    async def _run(self):
+        while True:
+            message = await self.queue.get()
+            try:
+                await self._send(message)
+                if self._suppressed and self.queue.empty():
+                    count, self._suppressed = self._suppressed, 0
+                    await self._send(self.overflow_message.format(count=count))
+            finally:
+                self.queue.task_done()
+
+    async def close(self):
+        """Stop the sender task. Messages still queued are discarded."""
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
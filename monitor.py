@@ -2,12 +2,15 @@ import time
 import asyncio
 from utils import (
     read_settings, read_servers, ping_check, port_check, http_check,
-    keyword_check, format_timedelta, send_telegram_message, notify_error,
+    keyword_check, format_timedelta, send_telegram_message,
     ConfigError, Settings
 )
 from display import get_display
+from report import StatusTracker
+from events import EventBus, Outbox, CheckResult, make_result, POLICY_BLOCK, POLICY_COALESCE
 import datetime
 import logging
+from typing import Optional
 from concurrent.futures import ThreadPoolExecutor
 
 # Get logger
@@ -19,41 +22,116 @@ executor = ThreadPoolExecutor(max_workers=10)
 # Shutdown event for graceful termination (will be created in event loop)
 shutdown_event = None
 
-# Declare dictionaries to store previous status, downtime start time and fail/recovery counts for each server
-previous_status = {}
-downtime_start = {}
+# Declare dictionaries to store fail/recovery counts for each server
 fail_count = {}
 recovery_count = {}
 
+# Configuration errors already sent to Telegram, so each one is only sent once
+reported_config_errors = set()
+
+# Subscribers the monitor cycle waits on before rendering and reporting
+CYCLE_SUBSCRIBERS = ("alerting", "display")
+
+# Upper bound on targets pending for the display; beyond this, results are dropped
+DISPLAY_MAX_TARGETS = 65536
+
+# Status, downtime start and report counters for each server, fed by the alerting subscriber
+status_tracker = StatusTracker()
+
 def generate_status_report():
-    """Generate a status report of all servers"""
-    down_servers = [server for server, status in previous_status.items() if status == "Down"]
-    up_servers = [server for server, status in previous_status.items() if status == "Up"]
-
-    if down_servers:
-        report = "🔴 Status Report - Servers Down:\n"
-        for server in down_servers:
-            report += f"- {server}\n"
+    """Generate a status report: counts per check type and what changed since the last report"""
+    return status_tracker.build_report()
+
+async def process_alert(settings: Settings, result: CheckResult, outbox: Optional[Outbox] = None):
+    """Alerting subscriber: apply failure/recovery thresholds and queue notifications on the outbox."""
+    description = result.description
+    status = result.status
+    if status == "Error":
+        # The check itself crashed; it says nothing about the target's state
+        return
+
+    if status == "Down":
+        fail_count[description] = fail_count.get(description, 0) + 1
+        recovery_count[description] = 0  # Reset recovery count on failure
+        if status_tracker.status(description) == "Down":
+            # Keeps per-type counters right if the type changed while Down; no-op otherwise
+            status_tracker.update(description, result.type_, "Down", result.timestamp)
+        elif fail_count[description] >= settings.failure_threshold:
+            message = f"❌ {description} is down"
+            if result.error is not None:
+                message += f". {result.error}"
+            status_tracker.update(description, result.type_, "Down", result.timestamp)
+            if outbox:
+                outbox.post(message)
     else:
-        report = "✅ Status Report - All Servers Up\n"
+        fail_count[description] = 0  # Reset failure count on success
+        was_down = status_tracker.status(description) == "Down"
+        if was_down:
+            recovery_count[description] = recovery_count.get(description, 0) + 1
+            if recovery_count[description] >= settings.recovery_threshold:
+                recovery_count[description] = 0
+                downtime = datetime.timedelta(seconds=result.timestamp - status_tracker.down_since(description))
+                status_tracker.update(description, result.type_, "Up", result.timestamp)
+                downtime_formatted = format_timedelta(downtime)
+                if outbox:
+                    outbox.post(f"✅ {description} is back up. Downtime: {downtime_formatted}")
+        else:
+            status_tracker.update(description, result.type_, "Up", result.timestamp)
 
-    if up_servers:
-        report += "\nServers Up:\n"
-        for server in up_servers:
-            report += f"- {server}\n"
+def prune_state(configured):
+    """Drop state for servers that were removed from servers.yaml"""
+    configured = set(configured)
+    for counts in (fail_count, recovery_count):
+        for description in [d for d in counts if d not in configured]:
+            del counts[description]
+    status_tracker.prune(configured)
 
-    return report
+def report_config_error(message: str, outbox: Optional[Outbox] = None):
+    """Log a per-target configuration error and queue it on the outbox the first time it is seen"""
+    logger.error(message)
+    if outbox and message not in reported_config_errors:
+        reported_config_errors.add(message)
+        outbox.post(f"⚠️ Configuration Error: {message}")
 
-async def check_server(settings: Settings, description, type_, target, port=None, keyword=None, expect_keyword=None, failure_threshold=None, recovery_threshold=None, display=None):
-    """Check a single server. Settings are passed in — never re-read per check."""
-    try:
-        if failure_threshold is None:
-            msg = f"BUG: failure_threshold is None for {description}"
-            logger.error(msg)
-            if settings.telegram_enabled:
-                await notify_error(msg, settings.chat_id, settings.bot_token)
-            return
+def create_outbox(settings: Settings) -> Optional[Outbox]:
+    """Create the Telegram outbox, or None if Telegram is disabled"""
+    if not settings.telegram_enabled:
+        return None
+
+    async def send(message: str):
+        await send_telegram_message(message, settings.chat_id, settings.bot_token)
+
+    outbox = Outbox("telegram", send)
+    outbox.start()
+    return outbox
+
+def create_bus(settings: Settings, display=None, outbox: Optional[Outbox] = None) -> EventBus:
+    """Create the result bus and attach the built-in subscribers.
+
+    Alerting uses the block policy so no state transition is ever lost; it only
+    posts to the outbox and never waits on the network. The display coalesces
+    to the latest result per target, so no target is missing from the table.
+    Only these two are drained each cycle (see CYCLE_SUBSCRIBERS); any other
+    subscriber consumes at its own pace.
+    """
+    bus = EventBus()
+
+    async def alert_handler(result: CheckResult):
+        await process_alert(settings, result, outbox)
+
+    bus.subscribe("alerting", alert_handler, maxsize=4096, policy=POLICY_BLOCK)
+
+    if display:
+        async def display_handler(result: CheckResult):
+            display.update_server(result.description, result.status, result.latency, result.error)
 
+        bus.subscribe("display", display_handler, maxsize=DISPLAY_MAX_TARGETS, policy=POLICY_COALESCE)
+
+    return bus
+
+async def check_server(settings: Settings, bus: EventBus, description, type_, target, port=None, keyword=None, expect_keyword=None, outbox: Optional[Outbox] = None):
+    """Check a single server and publish the result. Settings are passed in — never re-read per check."""
+    try:
         # Use ThreadPoolExecutor for blocking I/O checks
         if type_ == 'ping':
             status, latency, error = await asyncio.get_event_loop().run_in_executor(
@@ -69,62 +147,23 @@ async def check_server(settings: Settings, description, type_, target, port=None
             )
         elif type_ == 'keyword':
             if keyword is None or expect_keyword is None:
-                msg = f"BUG: keyword check misconfigured for {description}"
-                logger.error(msg)
-                if settings.telegram_enabled:
-                    await notify_error(msg, settings.chat_id, settings.bot_token)
+                report_config_error(f"BUG: keyword check misconfigured for {description}", outbox)
                 return
             status, latency, error = await asyncio.get_event_loop().run_in_executor(
                 executor, keyword_check, target, keyword, expect_keyword
             )
         else:
-            msg = f"BUG: unknown check type '{type_}' for {description}"
-            logger.error(msg)
-            if settings.telegram_enabled:
-                await notify_error(msg, settings.chat_id, settings.bot_token)
+            report_config_error(f"BUG: unknown check type '{type_}' for {description}", outbox)
             return
 
-        if status == "Down":
-            fail_count[description] = fail_count.get(description, 0) + 1
-            recovery_count[description] = 0  # Reset recovery count on failure
-            if previous_status.get(description) != "Down" and fail_count[description] >= failure_threshold:
-                message = f"❌ {description} is down"
-                if error is not None:
-                    message += f". {error}"
-                if settings.telegram_enabled:
-                    await send_telegram_message(message, settings.chat_id, settings.bot_token)
-                previous_status[description] = "Down"
-                downtime_start[description] = datetime.datetime.now()
-        else:
-            fail_count[description] = 0  # Reset failure count on success
-            was_down = previous_status.get(description) == "Down"
-            if was_down:
-                recovery_count[description] = recovery_count.get(description, 0) + 1
-                if recovery_count[description] >= recovery_threshold:
-                    previous_status[description] = "Up"
-                    recovery_count[description] = 0
-                    downtime = datetime.datetime.now() - downtime_start[description]
-                    downtime_formatted = format_timedelta(downtime)
-                    if settings.telegram_enabled:
-                        await send_telegram_message(
-                            f"✅ {description} is back up. Downtime: {downtime_formatted}",
-                            settings.chat_id,
-                            settings.bot_token
-                        )
-            else:
-                previous_status[description] = "Up"
-
-        # Update display
-        if display:
-            display.update_server(description, status, latency, error)
+        await bus.publish(make_result(description, type_, status, latency, error))
 
     except Exception as e:
         # LOUD failure — log AND print to stderr so systemd journal captures it
         error_msg = f"MONITOR ERROR checking {description}: {e}"
         logger.error(error_msg, exc_info=True)
         print(error_msg, flush=True)
-        if display:
-            display.update_server(description, "Error", None, str(e))
+        await bus.publish(make_result(description, type_, "Error", None, str(e)))
 
 async def monitor_servers(silent=False):
     """Monitor servers with enhanced error handling and configuration validation"""
@@ -150,91 +189,119 @@ async def monitor_servers(silent=False):
     # Initialize display
     display = get_display() if not silent else None
 
+    # Results flow from the checks to display and alerting through the bus
+    # Telegram alerts are sent from the outbox so slow sends never stall the bus
+    outbox = create_outbox(settings)
+    bus = create_bus(settings, display, outbox)
+    total_dropped = 0
+    total_suppressed = 0
+
     first_run = True
     consecutive_cycle_errors = 0
 
-    while not shutdown_event.is_set():
-        try:
-            # Re-read servers config to pick up changes
+    try:
+        while not shutdown_event.is_set():
             try:
-                servers = read_servers()
-            except ConfigError as e:
-                logger.error(f"Failed to reload servers.yaml: {e}")
-                print(f"pymon: failed to reload servers.yaml: {e}", flush=True)
-                # Use wait with timeout instead of sleep to respond to shutdown
+                # Re-read servers config to pick up changes
                 try:
-                    await asyncio.wait_for(shutdown_event.wait(), timeout=settings.check_interval)
-                    break  # Shutdown requested
-                except asyncio.TimeoutError:
-                    pass
-                continue
-
-            # Clear old results before new check cycle
-            if display:
-                display.clear_results()
-
-            # Check servers in parallel
-            tasks = []
-            for server in servers:
-                task = check_server(
-                    settings,
-                    server['description'],
-                    server['type'],
-                    server['target'],
-                    server.get('port'),
-                    server.get('keyword'),
-                    server.get('expect_keyword'),
-                    settings.failure_threshold,
-                    settings.recovery_threshold,
-                    display
-                )
-                tasks.append(task)
-
-            await asyncio.gather(*tasks)
-            consecutive_cycle_errors = 0  # Reset on successful cycle
-
-            # Print results after all checks complete
-            if display:
-                display.clear()
-                display.print_header()
-                display.print_results()
-
-            if first_run:
-                first_run = False
-                if settings.telegram_enabled:
-                    report = generate_status_report()
-                    await send_telegram_message(report, settings.chat_id, settings.bot_token)
-
-            # Send status report at specified interval
-            current_time = time.time()
-            if current_time - last_status_report_time >= status_report_interval_seconds:
-                if settings.telegram_enabled:
-                    report = generate_status_report()
-                    if not settings.report_only_on_down or "Down" in report:
-                        await send_telegram_message(report, settings.chat_id, settings.bot_token)
-                last_status_report_time = current_time
-
-        except Exception as e:
-            consecutive_cycle_errors += 1
-            error_msg = f"pymon: monitoring cycle error #{consecutive_cycle_errors}: {e}"
-            logger.error(error_msg, exc_info=True)
-            print(error_msg, flush=True)
-
-            # If we fail 10 cycles in a row, something is fundamentally broken
-            if consecutive_cycle_errors >= 10:
-                fatal_msg = f"pymon: FATAL — {consecutive_cycle_errors} consecutive cycle failures, last error: {e}"
-                logger.critical(fatal_msg)
-                print(fatal_msg, flush=True)
-                if settings.telegram_enabled:
-                    await send_telegram_message(f"🔥 {fatal_msg}", settings.chat_id, settings.bot_token)
-                raise RuntimeError(fatal_msg)
-
-        # Use wait with timeout instead of sleep to respond to shutdown quickly
-        try:
-            await asyncio.wait_for(shutdown_event.wait(), timeout=settings.check_interval)
-            break  # Shutdown requested
-        except asyncio.TimeoutError:
-            pass  # Continue monitoring
+                    servers = read_servers()
+                except ConfigError as e:
+                    logger.error(f"Failed to reload servers.yaml: {e}")
+                    print(f"pymon: failed to reload servers.yaml: {e}", flush=True)
+                    # Use wait with timeout instead of sleep to respond to shutdown
+                    try:
+                        await asyncio.wait_for(shutdown_event.wait(), timeout=settings.check_interval)
+                        break  # Shutdown requested
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                # Forget servers removed from servers.yaml so they stop counting as Up/Down
+                prune_state(server['description'] for server in servers)
+
+                # Clear old results before new check cycle
+                if display:
+                    display.clear_results()
+
+                # Check servers in parallel
+                tasks = []
+                for server in servers:
+                    task = check_server(
+                        settings,
+                        bus,
+                        server['description'],
+                        server['type'],
+                        server['target'],
+                        server.get('port'),
+                        server.get('keyword'),
+                        server.get('expect_keyword'),
+                        outbox
+                    )
+                    tasks.append(task)
+
+                await asyncio.gather(*tasks)
+                # Let alerting and display catch up so the screen and report see the whole cycle
+                if not await bus.drain(CYCLE_SUBSCRIBERS, timeout=settings.check_interval):
+                    logger.warning(f"Subscribers did not catch up within {settings.check_interval}s: {bus.stats()}")
+                consecutive_cycle_errors = 0  # Reset on successful cycle
+
+                dropped = sum(s["dropped"] for s in bus.stats().values())
+                if dropped > total_dropped:
+                    logger.warning(f"Event bus dropped {dropped - total_dropped} events this cycle: {bus.stats()}")
+                    total_dropped = dropped
+                if outbox and outbox.dropped > total_suppressed:
+                    logger.warning(f"Telegram outbox full, suppressed {outbox.dropped - total_suppressed} alerts this cycle")
+                    total_suppressed = outbox.dropped
+
+                # Print results after all checks complete
+                if display:
+                    display.clear()
+                    display.print_header()
+                    display.print_results()
+
+                if first_run:
+                    first_run = False
+                    if settings.telegram_enabled:
+                        report = generate_status_report()
+                        if await send_telegram_message(report, settings.chat_id, settings.bot_token):
+                            status_tracker.start_window()
+
+                # Send status report at specified interval
+                current_time = time.time()
+                if current_time - last_status_report_time >= status_report_interval_seconds:
+                    if settings.telegram_enabled:
+                        if not settings.report_only_on_down or status_tracker.down_count > 0:
+                            report = generate_status_report()
+                            # Keep unsent changes so they show up in the next report
+                            if await send_telegram_message(report, settings.chat_id, settings.bot_token):
+                                status_tracker.start_window()
+                    last_status_report_time = current_time
+
+            except Exception as e:
+                consecutive_cycle_errors += 1
+                error_msg = f"pymon: monitoring cycle error #{consecutive_cycle_errors}: {e}"
+                logger.error(error_msg, exc_info=True)
+                print(error_msg, flush=True)
+
+                # If we fail 10 cycles in a row, something is fundamentally broken
+                if consecutive_cycle_errors >= 10:
+                    fatal_msg = f"pymon: FATAL — {consecutive_cycle_errors} consecutive cycle failures, last error: {e}"
+                    logger.critical(fatal_msg)
+                    print(fatal_msg, flush=True)
+                    if settings.telegram_enabled:
+                        await send_telegram_message(f"🔥 {fatal_msg}", settings.chat_id, settings.bot_token)
+                    raise RuntimeError(fatal_msg)
+
+            # Use wait with timeout instead of sleep to respond to shutdown quickly
+            try:
+                await asyncio.wait_for(shutdown_event.wait(), timeout=settings.check_interval)
+                break  # Shutdown requested
+            except asyncio.TimeoutError:
+                pass  # Continue monitoring
+    finally:
+        await bus.close()
+        if outbox:
+            await outbox.close()
 
     logger.info("Monitor loop exited gracefully")
     print("pymon: shutdown complete", flush=True)
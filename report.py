@@ -0,0 +1,157 @@
+import datetime
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from utils import format_timedelta
+
+# Longest list printed per report section; the rest is summarised as a count
+REPORT_LIST_LIMIT = 100
+
+# Status changes within one report window after which a target counts as flapping
+FLAP_TRANSITIONS = 3
+
+
+class _Change:
+    """What happened to one target since the last report."""
+    __slots__ = ("transitions", "downtime")
+
+    def __init__(self):
+        self.transitions = 0
+        self.downtime = 0.0
+
+
+class StatusTracker:
+    """Incrementally maintained fleet state for alerts and status reports.
+
+    The alerting subscriber feeds every (thresholded) status into update(),
+    which keeps per-type Up/Down counters and the set of targets that changed
+    since the last report, so building a report never scans the whole fleet.
+    It is the only record of each target's status and downtime start.
+    """
+
+    def __init__(self):
+        self._status: Dict[str, Tuple[str, str]] = {}
+        self._down_since: Dict[str, float] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._changes: Dict[str, _Change] = {}
+
+    @property
+    def down_count(self) -> int:
+        return sum(counts["Down"] for counts in self._counts.values())
+
+    @property
+    def total_count(self) -> int:
+        return len(self._status)
+
+    def status(self, description: str) -> Optional[str]:
+        """Current status of a target, or None if it has not been seen yet."""
+        current = self._status.get(description)
+        return current[1] if current is not None else None
+
+    def down_since(self, description: str) -> Optional[float]:
+        """Timestamp at which a target went Down, or None if it is not Down."""
+        return self._down_since.get(description)
+
+    def update(self, description: str, type_: str, status: str, timestamp: float):
+        """Record the current status of a target. Cheap no-op if nothing changed."""
+        previous = self._status.get(description)
+        if previous == (type_, status):
+            return
+
+        if previous is not None:
+            self._counts[previous[0]][previous[1]] -= 1
+        self._counts.setdefault(type_, {"Up": 0, "Down": 0})[status] += 1
+        self._status[description] = (type_, status)
+
+        previous_status = previous[1] if previous is not None else None
+        if previous_status == status:
+            # Only the type changed (servers.yaml edited); not a state transition
+            return
+
+        if previous_status is None and status == "Up":
+            # First result for a healthy target is not worth reporting
+            return
+
+        change = self._changes.get(description)
+        if change is None:
+            change = self._changes[description] = _Change()
+        change.transitions += 1
+
+        if status == "Down":
+            self._down_since[description] = timestamp
+        else:
+            since = self._down_since.pop(description, None)
+            if since is not None:
+                change.downtime += timestamp - since
+
+    def prune(self, configured: Iterable[str]):
+        """Forget targets that are no longer configured."""
+        configured = set(configured)
+        for description in [d for d in self._status if d not in configured]:
+            type_, status = self._status.pop(description)
+            self._counts[type_][status] -= 1
+            self._down_since.pop(description, None)
+            self._changes.pop(description, None)
+
+    def start_window(self):
+        """Forget the changes already reported; the next report lists only newer ones."""
+        self._changes.clear()
+
+    def build_report(self, now: Optional[float] = None) -> str:
+        """Build a report with per-type counts and the changes since the last report.
+
+        New downs show how long the current outage has lasted at `now`. Recovered
+        and flapping targets show their total downtime, including any still-open
+        interval.
+        """
+        if now is None:
+            now = time.time()
+        down = self.down_count
+        total = self.total_count
+        if down:
+            lines = [f"🔴 Status Report - {down} of {total} Down"]
+        else:
+            lines = [f"✅ Status Report - All {total} Up"]
+
+        for type_ in sorted(self._counts):
+            counts = self._counts[type_]
+            if counts["Up"] or counts["Down"]:
+                lines.append(f"{type_}: {counts['Up']} up, {counts['Down']} down")
+
+        new_down: List[str] = []
+        recovered: List[str] = []
+        flapping: List[str] = []
+        for description, change in sorted(self._changes.items()):
+            status = self._status[description][1]
+            since = self._down_since.get(description)
+            if change.transitions < FLAP_TRANSITIONS and status == "Down":
+                # Only the current outage; earlier downtime in this window is not part of it
+                outage = format_timedelta(datetime.timedelta(seconds=max(0.0, now - since)))
+                new_down.append(f"- {description} (down for {outage})")
+                continue
+            downtime = change.downtime
+            if since is not None:
+                downtime += max(0.0, now - since)
+            downtime_formatted = format_timedelta(datetime.timedelta(seconds=downtime))
+            if change.transitions >= FLAP_TRANSITIONS:
+                flapping.append(
+                    f"- {description} ({change.transitions} changes, total downtime {downtime_formatted}, now {status})"
+                )
+            else:
+                recovered.append(f"- {description} (downtime {downtime_formatted})")
+
+        if not (new_down or recovered or flapping):
+            lines.append("\nNo changes since last report")
+        self._append_section(lines, "New Down", new_down)
+        self._append_section(lines, "Recovered", recovered)
+        self._append_section(lines, "Flapping", flapping)
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _append_section(lines: List[str], title: str, items: List[str]):
+        if not items:
+            return
+        lines.append(f"\n{title} ({len(items)}):")
+        lines.extend(items[:REPORT_LIST_LIMIT])
+        if len(items) > REPORT_LIST_LIMIT:
+            lines.append(f"...and {len(items) - REPORT_LIST_LIMIT} more")
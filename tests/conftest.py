@@ -0,0 +1,19 @@
+import os
+import sys
+
+# pymon is a flat set of modules at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import monitor
+from report import StatusTracker
+
+
+@pytest.fixture(autouse=True)
+def reset_monitor_state(monkeypatch):
+    """Give every test fresh module-level alert state."""
+    monkeypatch.setattr(monitor, "status_tracker", StatusTracker())
+    monkeypatch.setattr(monitor, "fail_count", {})
+    monkeypatch.setattr(monitor, "recovery_count", {})
+    monkeypatch.setattr(monitor, "reported_config_errors", set())
@@ -0,0 +1,246 @@
+import asyncio
+
+import pytest
+
+from events import (
+    EventBus, Outbox, make_result,
+    POLICY_BLOCK, POLICY_DROP_NEW, POLICY_DROP_OLDEST, POLICY_COALESCE
+)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_block_delivers_everything_in_order():
+    async def scenario():
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append(event.description)
+
+        bus.subscribe("all", handler, maxsize=2, policy=POLICY_BLOCK)
+        for i in range(50):
+            await bus.publish(make_result(f"t{i}", "ping", "Up"))
+        await bus.drain()
+        stats = bus.stats()["all"]
+        await bus.close()
+        return seen, stats
+
+    seen, stats = run(scenario())
+    assert seen == [f"t{i}" for i in range(50)]
+    assert stats["dropped"] == 0
+    assert stats["delivered"] == 50
+
+
+def test_drop_new_keeps_first_events():
+    async def scenario():
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append(event.description)
+
+        bus.subscribe("new", handler, maxsize=3, policy=POLICY_DROP_NEW)
+        # Nothing yields to the subscriber task between these publishes
+        for i in range(10):
+            await bus.publish(make_result(f"t{i}", "ping", "Up"))
+        await bus.drain()
+        stats = bus.stats()["new"]
+        await bus.close()
+        return seen, stats
+
+    seen, stats = run(scenario())
+    assert seen == ["t0", "t1", "t2"]
+    assert stats["dropped"] == 7
+
+
+def test_drop_oldest_keeps_latest_events():
+    async def scenario():
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append(event.description)
+
+        bus.subscribe("old", handler, maxsize=3, policy=POLICY_DROP_OLDEST)
+        for i in range(10):
+            await bus.publish(make_result(f"t{i}", "ping", "Up"))
+        await bus.drain()
+        stats = bus.stats()["old"]
+        await bus.close()
+        return seen, stats
+
+    seen, stats = run(scenario())
+    assert seen == ["t7", "t8", "t9"]
+    assert stats["dropped"] == 7
+
+
+def test_coalesce_delivers_latest_result_per_target():
+    async def scenario():
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append((event.description, event.status))
+
+        bus.subscribe("display", handler, maxsize=100, policy=POLICY_COALESCE)
+        for i in range(100):
+            await bus.publish(make_result(f"t{i}", "ping", "Up"))
+        await bus.publish(make_result("t5", "ping", "Down"))
+        await bus.drain()
+        stats = bus.stats()["display"]
+        await bus.close()
+        return seen, stats
+
+    seen, stats = run(scenario())
+    assert len(seen) == 100
+    assert ("t5", "Down") in seen
+    assert ("t5", "Up") not in seen
+    assert stats["dropped"] == 1
+
+
+def test_coalesce_bounds_pending_targets():
+    async def scenario():
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append((event.description, event.status))
+
+        bus.subscribe("display", handler, maxsize=3, policy=POLICY_COALESCE)
+        for i in range(10):
+            await bus.publish(make_result(f"t{i}", "ping", "Up"))
+        # Pending targets are still replaced once the bound is reached
+        await bus.publish(make_result("t1", "ping", "Down"))
+        await bus.drain()
+        stats = bus.stats()["display"]
+        await bus.close()
+        return seen, stats
+
+    seen, stats = run(scenario())
+    assert seen == [("t0", "Up"), ("t1", "Down"), ("t2", "Up")]
+    assert stats["dropped"] == 8
+
+
+def test_drain_only_waits_on_named_subscribers():
+    async def scenario():
+        bus = EventBus()
+        release = asyncio.Event()
+        seen = []
+
+        async def fast(event):
+            seen.append(event.description)
+
+        async def stuck(event):
+            await release.wait()
+
+        bus.subscribe("fast", fast)
+        bus.subscribe("history", stuck, policy=POLICY_DROP_NEW)
+        for i in range(5):
+            await bus.publish(make_result(f"t{i}", "ping", "Up"))
+        drained = await bus.drain(["fast"], timeout=5)
+        timed_out = not await bus.drain(timeout=0.01)
+        release.set()
+        await bus.close()
+        return drained, timed_out, seen
+
+    drained, timed_out, seen = run(scenario())
+    assert drained
+    assert timed_out
+    assert seen == [f"t{i}" for i in range(5)]
+
+
+class Fatal(BaseException):
+    pass
+
+
+def test_drain_does_not_hang_on_dead_subscriber():
+    async def scenario():
+        bus = EventBus()
+
+        async def handler(event):
+            raise Fatal
+
+        subscription = bus.subscribe("dead", handler)
+        await bus.publish(make_result("t", "ping", "Up"))
+        # Let the subscriber task run and die
+        await asyncio.gather(subscription.task, return_exceptions=True)
+        drained = await bus.drain()
+        await bus.close()
+        return drained
+
+    assert run(scenario()) is False
+
+
+def test_failing_handler_does_not_stop_subscriber():
+    async def scenario():
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            if event.description == "bad":
+                raise RuntimeError("boom")
+            seen.append(event.description)
+
+        bus.subscribe("flaky", handler)
+        await bus.publish(make_result("bad", "ping", "Up"))
+        await bus.publish(make_result("good", "ping", "Up"))
+        await bus.drain()
+        stats = bus.stats()["flaky"]
+        await bus.close()
+        return seen, stats
+
+    seen, stats = run(scenario())
+    assert seen == ["good"]
+    assert stats["failed"] == 1
+
+
+def test_close_cancels_subscriber_tasks():
+    async def scenario():
+        bus = EventBus()
+
+        async def handler(event):
+            await asyncio.sleep(60)
+
+        subscription = bus.subscribe("slow", handler)
+        await bus.publish(make_result("t", "ping", "Up"))
+        await asyncio.sleep(0)
+        await bus.close()
+        return subscription.task
+
+    task = run(scenario())
+    assert task.cancelled()
+
+
+def test_invalid_policy_rejected():
+    async def scenario():
+        EventBus().subscribe("x", None, policy="lossy")
+
+    with pytest.raises(ValueError):
+        run(scenario())
+
+
+def test_outbox_post_never_waits_on_sender():
+    async def scenario():
+        release = asyncio.Event()
+        sent = []
+
+        async def send(message):
+            await release.wait()
+            sent.append(message)
+
+        outbox = Outbox("test", send, maxsize=3)
+        outbox.start()
+        # The sender is blocked, yet every post returns immediately
+        accepted = [outbox.post(f"m{i}") for i in range(5)]
+        release.set()
+        await outbox.queue.join()
+        await outbox.close()
+        return accepted, sent, outbox.dropped
+
+    accepted, sent, dropped = run(scenario())
+    assert accepted == [True, True, True, False, False]
+    assert sent == ["m0", "m1", "m2", "⚠️ 2 more alerts suppressed; see next status report"]
+    assert dropped == 2
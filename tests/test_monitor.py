@@ -0,0 +1,101 @@
+import asyncio
+
+import monitor
+from events import make_result
+from utils import Settings
+
+
+def settings():
+    return Settings(
+        bot_token=None,
+        chat_id=None,
+        failure_threshold=1,
+        recovery_threshold=1,
+        check_interval=60,
+        status_report_interval=60,
+        report_only_on_down=False,
+    )
+
+
+def test_slow_alert_delivery_does_not_block_the_bus():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def send(message):
+            await release.wait()
+
+        outbox = monitor.Outbox("test", send)
+        outbox.start()
+        bus = monitor.create_bus(settings(), outbox=outbox)
+        for i in range(200):
+            await bus.publish(make_result(f"slow-{i}", "ping", "Down", error="Timeout"))
+        # Alerting has handled every event while the sender is still blocked
+        drained = await bus.drain(monitor.CYCLE_SUBSCRIBERS, timeout=5)
+        delivered = bus.stats()["alerting"]["delivered"]
+        pending = outbox.queue.qsize()
+        release.set()
+        await bus.close()
+        await outbox.close()
+        return drained, delivered, pending
+
+    drained, delivered, pending = asyncio.run(scenario())
+    assert drained
+    assert delivered == 200
+    assert pending >= 199
+    assert monitor.status_tracker.down_count == 200
+
+
+def test_config_errors_are_queued_once():
+    async def scenario():
+        posted = []
+
+        class Recorder:
+            def post(self, message):
+                posted.append(message)
+
+        for _ in range(3):
+            await monitor.check_server(settings(), None, "bad", "smtp", "example.com", outbox=Recorder())
+        return posted
+
+    assert asyncio.run(scenario()) == ["⚠️ Configuration Error: BUG: unknown check type 'smtp' for bad"]
+
+
+def test_alert_thresholds_use_tracker_state():
+    async def scenario():
+        posted = []
+
+        class Recorder:
+            def post(self, message):
+                posted.append(message)
+
+        for status, timestamp in (("Down", 100.0), ("Up", 190.0)):
+            result = make_result("state-a", "ping", status)._replace(timestamp=timestamp)
+            await monitor.process_alert(settings(), result, Recorder())
+        return posted
+
+    posted = asyncio.run(scenario())
+    assert posted == ["❌ state-a is down", "✅ state-a is back up. Downtime: 1m 30s"]
+    assert monitor.status_tracker.status("state-a") == "Up"
+
+
+def test_prune_state_forgets_removed_servers():
+    async def scenario():
+        await monitor.process_alert(settings(), make_result("prune-a", "ping", "Down"))
+
+    asyncio.run(scenario())
+    assert monitor.status_tracker.status("prune-a") == "Down"
+    monitor.prune_state([])
+    assert monitor.status_tracker.status("prune-a") is None
+    assert "prune-a" not in monitor.fail_count
+    assert monitor.status_tracker.down_count == 0
+
+
+def test_type_change_while_down_updates_counters():
+    async def scenario():
+        await monitor.process_alert(settings(), make_result("retyped", "ping", "Down"))
+        await monitor.process_alert(settings(), make_result("retyped", "http", "Down"))
+
+    asyncio.run(scenario())
+    report = monitor.status_tracker.build_report()
+    assert "http: 0 up, 1 down" in report
+    assert "ping" not in report
@@ -0,0 +1,104 @@
+from report import StatusTracker, REPORT_LIST_LIMIT
+
+
+def fleet(size=10):
+    tracker = StatusTracker()
+    for i in range(size):
+        tracker.update(f"h{i}", "ping" if i % 2 else "http", "Up", 0)
+    tracker.start_window()
+    return tracker
+
+
+def test_counts_per_type():
+    tracker = fleet()
+    tracker.update("h1", "ping", "Down", 10)
+    report = tracker.build_report(now=20)
+    assert report.startswith("🔴 Status Report - 1 of 10 Down")
+    assert "http: 5 up, 0 down" in report
+    assert "ping: 4 up, 1 down" in report
+
+
+def test_all_up_without_changes():
+    report = fleet().build_report(now=0)
+    assert report.startswith("✅ Status Report - All 10 Up")
+    assert "No changes since last report" in report
+
+
+def test_new_down_includes_open_downtime():
+    tracker = fleet()
+    tracker.update("h1", "ping", "Down", 100)
+    report = tracker.build_report(now=400)
+    assert "New Down (1):\n- h1 (down for 5m 0s)" in report
+
+
+def test_recovery_reports_downtime():
+    tracker = fleet()
+    tracker.update("h2", "http", "Down", 100)
+    tracker.update("h2", "http", "Up", 160)
+    report = tracker.build_report(now=200)
+    assert "Recovered (1):\n- h2 (downtime 1m 0s)" in report
+    assert "New Down" not in report
+
+
+def test_flapping_includes_open_interval():
+    tracker = fleet()
+    tracker.update("h3", "ping", "Down", 1000)
+    tracker.update("h3", "ping", "Up", 1005)
+    tracker.update("h3", "ping", "Down", 1010)
+    report = tracker.build_report(now=1070)
+    assert "Flapping (1):\n- h3 (3 changes, total downtime 1m 5s, now Down)" in report
+
+
+def test_new_down_shows_current_outage_only():
+    tracker = fleet()
+    tracker.update("h1", "ping", "Down", 0)
+    tracker.start_window()
+    tracker.update("h1", "ping", "Up", 100)
+    tracker.update("h1", "ping", "Down", 200)
+    report = tracker.build_report(now=300)
+    assert "New Down (1):\n- h1 (down for 1m 40s)" in report
+
+
+def test_type_change_moves_counters():
+    tracker = fleet()
+    tracker.update("h1", "ping", "Down", 10)
+    tracker.update("h1", "http", "Down", 20)
+    report = tracker.build_report(now=30)
+    assert "http: 5 up, 1 down" in report
+    assert "ping: 4 up, 0 down" in report
+    assert tracker.down_since("h1") == 10
+
+
+def test_start_window_keeps_counts_but_forgets_changes():
+    tracker = fleet()
+    tracker.update("h1", "ping", "Down", 10)
+    tracker.start_window()
+    report = tracker.build_report(now=20)
+    assert "1 of 10 Down" in report
+    assert "No changes since last report" in report
+    assert tracker.down_since("h1") == 10
+
+
+def test_repeated_status_is_not_a_change():
+    tracker = fleet()
+    tracker.update("h1", "ping", "Up", 10)
+    assert "No changes since last report" in tracker.build_report(now=10)
+
+
+def test_prune_removes_deleted_targets():
+    tracker = fleet()
+    tracker.update("h1", "ping", "Down", 10)
+    tracker.prune(f"h{i}" for i in range(2, 10))
+    assert tracker.down_count == 0
+    assert tracker.total_count == 8
+    assert tracker.status("h1") is None
+    assert tracker.build_report(now=20).startswith("✅ Status Report - All 8 Up")
+
+
+def test_long_sections_are_capped():
+    tracker = fleet(REPORT_LIST_LIMIT + 20)
+    for i in range(REPORT_LIST_LIMIT + 20):
+        tracker.update(f"h{i}", "ping" if i % 2 else "http", "Down", 10)
+    report = tracker.build_report(now=20)
+    assert f"New Down ({REPORT_LIST_LIMIT + 20}):" in report
+    assert "...and 20 more" in report
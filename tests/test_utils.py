@@ -0,0 +1,35 @@
+from utils import split_message, telegram_length
+
+
+def test_short_message_is_not_split():
+    assert split_message("hello\n", limit=10) == ["hello\n"]
+
+
+def test_split_on_line_boundaries():
+    message = "".join(f"line {i}\n" for i in range(100))
+    chunks = split_message(message, limit=50)
+    assert "".join(chunks) == message
+    assert all(telegram_length(chunk) <= 50 for chunk in chunks)
+    assert all(chunk.endswith("\n") for chunk in chunks)
+
+
+def test_oversized_line_is_hard_split():
+    message = "x" * 25 + "\nab\n"
+    chunks = split_message(message, limit=10)
+    assert "".join(chunks) == message
+    assert all(telegram_length(chunk) <= 10 for chunk in chunks)
+
+
+def test_limit_counts_utf16_units():
+    line = "🔴" * 10 + "\n"
+    assert telegram_length(line) == 21
+    chunks = split_message(line * 10, limit=50)
+    assert "".join(chunks) == line * 10
+    assert all(telegram_length(chunk) <= 50 for chunk in chunks)
+
+
+def test_hard_split_keeps_emoji_whole():
+    message = "🔴" * 30
+    chunks = split_message(message, limit=11)
+    assert "".join(chunks) == message
+    assert all(telegram_length(chunk) <= 11 for chunk in chunks)
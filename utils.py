@@ -7,7 +7,7 @@ import asyncio
 from dotenv import load_dotenv
 from requests.exceptions import SSLError
 from telegram import Bot
-from typing import NamedTuple, Optional, Tuple, Dict, Any
+from typing import NamedTuple, Optional, Tuple, Dict, Any, List
 import logging
 
 load_dotenv()
@@ -121,18 +121,59 @@ def read_servers():
     except Exception as e:
         raise ConfigError(f"Error reading {servers_file}: {str(e)}")
 
-async def send_telegram_message(message: str, chat_id: str, bot_token: str, retry_count: int = 3):
-    """Send Telegram message with retries"""
-    for attempt in range(retry_count):
-        try:
-            bot = Bot(token=bot_token)
-            await bot.send_message(chat_id=chat_id, text=message)
-            return
-        except Exception as e:
-            if attempt == retry_count - 1:  # Last attempt
-                logger.error(f"Failed to send Telegram message after {retry_count} attempts: {e}")
-            else:
+# Telegram rejects messages over 4096 characters, counted in UTF-16 code units
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+def telegram_length(text: str) -> int:
+    """Length of text as Telegram counts it: characters outside the BMP (e.g. emoji) count as two"""
+    return len(text.encode("utf-16-le")) // 2
+
+def split_message(message: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> List[str]:
+    """Split a message into chunks of at most `limit` UTF-16 units, preferring line boundaries"""
+    if telegram_length(message) <= limit:
+        return [message]
+
+    chunks = []
+    current = []
+    current_len = 0
+    for line in message.splitlines(keepends=True):
+        line_len = telegram_length(line)
+        if current and current_len + line_len > limit:
+            chunks.append("".join(current))
+            current, current_len = [], 0
+        if line_len <= limit:
+            current.append(line)
+            current_len += line_len
+            continue
+        # A single oversized line is hard-split rather than dropped, never inside a surrogate pair
+        for char in line:
+            char_len = 2 if ord(char) > 0xFFFF else 1
+            if current_len + char_len > limit:
+                chunks.append("".join(current))
+                current, current_len = [], 0
+            current.append(char)
+            current_len += char_len
+    if current:
+        chunks.append("".join(current))
+    return [chunk for chunk in chunks if chunk.strip()]
+
+async def send_telegram_message(message: str, chat_id: str, bot_token: str, retry_count: int = 3) -> bool:
+    """Send Telegram message with retries, split across several messages if too long.
+
+    Returns True if every part was sent.
+    """
+    for chunk in split_message(message):
+        for attempt in range(retry_count):
+            try:
+                bot = Bot(token=bot_token)
+                await bot.send_message(chat_id=chat_id, text=chunk)
+                break
+            except Exception as e:
+                if attempt == retry_count - 1:  # Last attempt
+                    logger.error(f"Failed to send Telegram message after {retry_count} attempts: {e}")
+                    return False
                 await asyncio.sleep(1)  # Wait before retry
+    return True
 
 def format_timedelta(delta):
     """Format a timedelta into a human-readable string"""